@@ -1,13 +1,17 @@
-import csv
+import re
 
 input_file = "data/user_feedback.csv"
 output_file = "data/user_feedback_clean.csv"
 
-with open(input_file, "r", encoding="utf-8") as infile, \
-     open(output_file, "w", newline="", encoding="utf-8") as outfile:
+# Any tab or run of multiple spaces is a field separator
+SEPARATOR = re.compile(r"\t| {2,}")
+BUFFER_SIZE = 1 << 20  # 1 MiB I/O buffers
+
+with open(input_file, "r", encoding="utf-8", buffering=BUFFER_SIZE) as infile, \
+     open(output_file, "w", newline="", encoding="utf-8", buffering=BUFFER_SIZE) as outfile:
     for line in infile:
         # Replace any tab or multiple spaces with a comma
-        clean = line.replace("\t", ",").replace("  ", ",").strip()
+        clean = SEPARATOR.sub(",", line).strip()
         outfile.write(clean + "\n")
 
 print("✅ Clean CSV saved as:", output_file)
@@ -1,59 +1,74 @@
 # Purpose: Generate a dataset of color pairs and label their comfort based on WCAG contrast ratio.
 # Language: Python 3
 
-import random
+import argparse
+import numpy as np
 import pandas as pd
 
+parser = argparse.ArgumentParser(description="Generate the color pair comfort dataset")
+parser.add_argument("--verbose", action="store_true", help="print a preview of the dataset")
+args = parser.parse_args()
+
+# Seeded PCG64 generator so the dataset is reproducible
+rng = np.random.default_rng(42)
+
+# WCAG 2.1 relative luminance weights for the R, G and B channels
+WCAG_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+# sRGB → linear lookup table; channels are uint8 so only 256 inputs exist
+_v = np.arange(256) / 255.0
+SRGB_LUT = np.where(_v <= 0.03928, _v / 12.92, ((_v + 0.055) / 1.055) ** 2.4)
+
 # ----------------------------------------------------
 # Step 1 — Define functions for luminance and contrast
 # ----------------------------------------------------
-def luminance(r, g, b):
+def luminance(rgb):
     """
-    Compute relative luminance of a color using the WCAG 2.1 formula.
-    Input: RGB values (0–255)
-    Output: Luminance between 0 and 1
+    Compute relative luminance of colors using the WCAG 2.1 formula.
+    Input: integer array of RGB values (0–255), shape (N, 3)
+    Output: Luminance between 0 and 1, shape (N,)
     """
-    a = [v / 255.0 for v in (r, g, b)]
-    a = [v / 12.92 if v <= 0.03928 else ((v + 0.055) / 1.055) ** 2.4 for v in a]
-    return 0.2126 * a[0] + 0.7152 * a[1] + 0.0722 * a[2]
+    return SRGB_LUT[rgb] @ WCAG_WEIGHTS
 
 def contrast_ratio(fg, bg):
     """
     Calculate WCAG contrast ratio between foreground and background.
-    Output: Number between 1 and 21
+    Input: arrays of RGB values, shape (N, 3)
+    Output: Numbers between 1 and 21, shape (N,)
     """
-    L1 = luminance(*fg)
-    L2 = luminance(*bg)
-    return (max(L1, L2) + 0.05) / (min(L1, L2) + 0.05)
+    L1 = luminance(fg)
+    L2 = luminance(bg)
+    return (np.maximum(L1, L2) + 0.05) / (np.minimum(L1, L2) + 0.05)
 
 
 # ----------------------------------------------------
 # Step 2 — Generate random color pairs
 # ----------------------------------------------------
-rows = []
-for _ in range(5000):  # Generate 5,000 examples
-    fg = [random.randint(0, 255) for _ in range(3)]
-    bg = [random.randint(0, 255) for _ in range(3)]
-    ratio = contrast_ratio(fg, bg)
+N_SAMPLES = 5000  # Generate 5,000 examples
 
-    # ------------------------------------------------
-    # Step 3 — Label according to comfort rule
-    # ------------------------------------------------
-    # For now: ≥ 4.5 = comfortable, else uncomfortable
-    label = 1 if ratio >= 4.5 else 0
+# One row per sample: fg_r, fg_g, fg_b, bg_r, bg_g, bg_b
+rgb = rng.integers(0, 256, size=(N_SAMPLES, 6), dtype=np.uint8)
+fg = rgb[:, :3]
+bg = rgb[:, 3:]
+ratio = contrast_ratio(fg, bg)
 
-    rows.append({
-        "fg_r": fg[0], "fg_g": fg[1], "fg_b": fg[2],
-        "bg_r": bg[0], "bg_g": bg[1], "bg_b": bg[2],
-        "contrast_ratio": ratio,
-        "label": label
-    })
+# ----------------------------------------------------
+# Step 3 — Label according to comfort rule
+# ----------------------------------------------------
+# For now: ≥ 4.5 = comfortable, else uncomfortable
+label = (ratio >= 4.5).astype(np.int8)
 
 
 # ----------------------------------------------------
 # Step 4 — Save to CSV
 # ----------------------------------------------------
-df = pd.DataFrame(rows)
+# Assemble columns straight from the typed arrays (no per-row Python objects)
+COLOR_COLUMNS = ["fg_r", "fg_g", "fg_b", "bg_r", "bg_g", "bg_b"]
+columns = {name: rgb[:, i] for i, name in enumerate(COLOR_COLUMNS)}
+columns["contrast_ratio"] = ratio.astype(np.float32)
+columns["label"] = label
+df = pd.DataFrame(columns)
 df.to_csv("data/color_pairs.csv", index=False)
 print("✅ Dataset saved at: data/color_pairs.csv")
-print(df.head())
+if args.verbose:
+    print(df.head())
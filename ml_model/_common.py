@@ -0,0 +1,192 @@
+# Purpose: Shared helpers for the color comfort training scripts
+# Language: Python 3 (scikit-learn)
+
+import os
+import numpy as np
+import pandas as pd
+import joblib
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.model_selection import train_test_split
+
+# Fixed codec so any machine with joblib can load the models: zlib, level 3
+MODEL_COMPRESS = ('zlib', 3)
+
+PAIRS_PATH = 'data/color_pairs.csv'
+PAIRS_CACHE_PATH = 'data/color_pairs.feather'
+FEEDBACK_PATH = 'data/user_feedback_clean.csv'
+
+# Feature columns shared by every color comfort model
+COLOR_FEATURES = ['fg_r', 'fg_g', 'fg_b', 'bg_r', 'bg_g', 'bg_b', 'contrast_ratio']
+
+# Columns a cleaned feedback CSV must have: the rated colors and the rating
+FEEDBACK_COLUMNS = COLOR_FEATURES + ['status']
+
+# Feature columns of the context-aware model
+CONTEXT_FEATURES = COLOR_FEATURES + ['element_type_id', 'font_size', 'font_weight']
+ELEMENT_TYPES = np.array(['button', 'a', 'footer', 'header', 'h1', 'p', 'span', 'div'])
+
+# Model hyperparameters, shared by the standalone scripts and train_all.py
+# Base and personalized models: fit_hgb(); context model: fit_rf()
+BASE_MODEL_PARAMS = dict(max_iter=200, max_depth=8, learning_rate=0.1,
+                         early_stopping=True, random_state=42)
+CONTEXT_MODEL_PARAMS = dict(n_estimators=200, class_weight='balanced', max_depth=12,
+                            random_state=42)
+PERSONALIZED_MODEL_PARAMS = BASE_MODEL_PARAMS
+
+# Smallest feedback set that is split into train/test rows (20% of 5 = 1 row)
+MIN_FEEDBACK_HOLDOUT = 5
+
+# Column dtypes of the base dataset, so the CSV parser skips type inference
+PAIRS_DTYPES = {
+    'fg_r': 'uint8', 'fg_g': 'uint8', 'fg_b': 'uint8',
+    'bg_r': 'uint8', 'bg_g': 'uint8', 'bg_b': 'uint8',
+    'contrast_ratio': 'float32',
+    'label': 'int8',
+}
+
+
+def load_pairs(path=PAIRS_PATH, cache_path=PAIRS_CACHE_PATH):
+    """
+    Load the base color pair dataset generated by data/generate_dataset.py.
+    The CSV is parsed once and cached as a Feather file next to it; later
+    loads read the cache unless the CSV has been regenerated since (or
+    read it alone if the CSV is gone).
+    Output: DataFrame with COLOR_FEATURES and 'label' columns
+    """
+    if (os.path.exists(cache_path)
+            and (not os.path.exists(path)
+                 or os.path.getmtime(cache_path) >= os.path.getmtime(path))):
+        return pd.read_feather(cache_path)
+
+    df = pd.read_csv(path, dtype=PAIRS_DTYPES)
+    try:
+        df.to_feather(cache_path)
+    except ImportError:
+        pass  # pyarrow not installed: keep reading the CSV each time
+    return df
+
+
+def load_feedback(path=FEEDBACK_PATH):
+    """
+    Load cleaned user feedback as labeled samples.
+    Each feedback row records the colors the user rated:
+      fg_r, fg_g, fg_b, bg_r, bg_g, bg_b, contrast_ratio, status
+    Output: DataFrame with COLOR_FEATURES and 'label' columns
+    (raises ValueError if the file lacks any of FEEDBACK_COLUMNS)
+    """
+    feedback = pd.read_csv(path)
+    missing = [col for col in FEEDBACK_COLUMNS if col not in feedback.columns]
+    if missing:
+        raise ValueError(
+            f"{path} is missing columns {missing}; expected {', '.join(FEEDBACK_COLUMNS)}. "
+            "content.js does not log colors yet, so build this file from the feedback "
+            "export, which records fg/bg colors and contrast ratio per element")
+
+    # Assign comfort levels based on feedback:
+    #   comfortable → label 1
+    #   uncomfortable → label 0
+    samples = feedback[COLOR_FEATURES].copy()
+    samples['label'] = feedback['status'].map({'comfortable': 1, 'uncomfortable': 0})
+    return samples.dropna(subset=['label'])
+
+
+def add_context_features(df, rng):
+    """
+    Add simulated element type, font size and font weight columns to df.
+    Output: df with the extra CONTEXT_FEATURES columns
+    """
+    # Element ids are 1-based positions in ELEMENT_TYPES
+    element_idx = rng.integers(0, len(ELEMENT_TYPES), len(df))
+    df['element_type'] = ELEMENT_TYPES[element_idx]
+    df['element_type_id'] = element_idx + 1
+    df['font_size'] = rng.integers(10, 24, len(df))
+    df['font_weight'] = rng.choice([300, 400, 500, 600, 700], len(df))
+    return df
+
+
+def feature_matrix(df, columns):
+    """
+    Extract model inputs as a float32 array (the dtype sklearn trees use
+    internally), avoiding a float64 copy and conversion inside fit/predict.
+    """
+    return df[columns].to_numpy(dtype=np.float32)
+
+
+def labels(df):
+    """
+    Extract the comfort label column as a compact int8 array.
+    """
+    return df['label'].to_numpy(dtype=np.int8)
+
+
+def split_dataset(X, y):
+    """
+    Hold out 20% of the rows for testing, with a fixed seed.
+    Every script splits the base dataset through this function, so all
+    models trained on it hold out the same base rows.
+    Output: X_train, X_test, y_train, y_test
+    """
+    return train_test_split(X, y, test_size=0.2, random_state=42)
+
+
+def split_personalized(base, feedback):
+    """
+    Split base and feedback rows for the personalized model.
+    The base rows are split exactly like train_model.py splits them and the
+    feedback rows are split on their own, so the held-out base rows match
+    the base model's test set and both accuracies are comparable.
+    With fewer than MIN_FEEDBACK_HOLDOUT feedback rows, all of them go to
+    the training part.
+    Output: X_train, X_test, y_train, y_test
+    """
+    Xb_train, Xb_test, yb_train, yb_test = split_dataset(
+        feature_matrix(base, COLOR_FEATURES), labels(base))
+    Xf = feature_matrix(feedback, COLOR_FEATURES)
+    yf = labels(feedback)
+    if len(feedback) < MIN_FEEDBACK_HOLDOUT:
+        # Too few rows to split: train on all of them, test on base rows only
+        print(f"⚠️  Only {len(feedback)} feedback rows: all used for training, none held out")
+        Xf_train, Xf_test, yf_train, yf_test = Xf, Xf[:0], yf, yf[:0]
+    else:
+        Xf_train, Xf_test, yf_train, yf_test = split_dataset(Xf, yf)
+    return (np.concatenate([Xb_train, Xf_train]), np.concatenate([Xb_test, Xf_test]),
+            np.concatenate([yb_train, yf_train]), np.concatenate([yb_test, yf_test]))
+
+
+def fit_rf(X, y, **params):
+    """
+    Train a Random Forest on (X, y).
+    X is passed to the trees in Fortran order so split search scans each
+    feature column contiguously.
+    Trees are built in parallel on all available cores unless n_jobs is given,
+    and each tree sees a half-size bootstrap sample to bound fit-time memory.
+    Output: fitted RandomForestClassifier
+    """
+    params.setdefault('n_jobs', -1)
+    params.setdefault('max_samples', 0.5)
+    params.setdefault('max_features', 'sqrt')
+    model = RandomForestClassifier(**params)
+    model.fit(np.asfortranarray(X, dtype=np.float32), y)
+    return model
+
+
+def fit_hgb(X, y, **params):
+    """
+    Train a histogram gradient boosting model on (X, y).
+    Features are pre-binned into at most max_bins uint8 bins (64 by default;
+    WCAG contrast thresholds are coarse), so split search scans small
+    histograms instead of sorted float columns.
+    Output: fitted HistGradientBoostingClassifier
+    """
+    params.setdefault('max_bins', 64)
+    model = HistGradientBoostingClassifier(**params)
+    model.fit(X, y)
+    return model
+
+
+def save_model(model, path):
+    """
+    Persist a trained model as a zlib-compressed pickle (protocol 5);
+    compression shrinks forest pickles several times over on disk.
+    """
+    joblib.dump(model, path, compress=MODEL_COMPRESS, protocol=5)
@@ -0,0 +1,87 @@
+# Purpose: Train every color comfort model in one run, fitting them in parallel
+# Language: Python 3 (scikit-learn + joblib)
+
+import os
+import numpy as np
+from joblib import Parallel, cpu_count, delayed
+
+from _common import (COLOR_FEATURES, CONTEXT_FEATURES, FEEDBACK_PATH,
+                     BASE_MODEL_PARAMS, CONTEXT_MODEL_PARAMS, PERSONALIZED_MODEL_PARAMS,
+                     load_pairs, load_feedback, add_context_features,
+                     split_dataset, split_personalized,
+                     feature_matrix, labels, fit_rf, fit_hgb, save_model)
+
+# Seeded PCG64 generator so the simulated context is reproducible
+rng = np.random.default_rng(42)
+
+
+def fit_job(name, fit, split, params):
+    """
+    Train and score one model (runs inside a worker process).
+    Input: split = (X_train, X_test, y_train, y_test)
+    Output: (name, fitted model, test accuracy)
+    """
+    X_train, X_test, y_train, y_test = split
+    model = fit(X_train, y_train, **params)
+    return name, model, model.score(X_test, y_test)
+
+
+# ------------------------------------------------------------
+# Step 1 — Load the base dataset once
+# ------------------------------------------------------------
+base = load_pairs()
+print(f"✅ Loaded base dataset: {len(base)} samples")
+
+# ------------------------------------------------------------
+# Step 2 — Build one job per model
+# ------------------------------------------------------------
+# Each entry: output path → (fit helper, train/test split, model parameters)
+specs = {
+    'ml_model/color_comfort_model.pkl': (
+        fit_hgb, split_dataset(feature_matrix(base, COLOR_FEATURES), labels(base)),
+        BASE_MODEL_PARAMS,
+    ),
+}
+
+context = add_context_features(base.copy(), rng)
+specs['ml_model/color_comfort_context.pkl'] = (
+    fit_rf, split_dataset(feature_matrix(context, CONTEXT_FEATURES), labels(context)),
+    CONTEXT_MODEL_PARAMS,
+)
+
+feedback = None
+if os.path.exists(FEEDBACK_PATH):
+    try:
+        feedback = load_feedback()
+    except ValueError as e:
+        print(f"⚠️  {e}")
+        print("⚠️  Skipping personalized model")
+else:
+    print(f"⚠️  {FEEDBACK_PATH} not found, skipping personalized model")
+
+if feedback is not None:
+    specs['ml_model/color_comfort_model_personalized.pkl'] = (
+        fit_hgb, split_personalized(base, feedback),
+        PERSONALIZED_MODEL_PARAMS,
+    )
+
+# ------------------------------------------------------------
+# Step 3 — Fit all models in parallel
+# ------------------------------------------------------------
+# Split the cores between the jobs so tree building does not oversubscribe
+n_jobs = len(specs)
+trees_per_job = max(1, cpu_count() // n_jobs)
+
+results = Parallel(n_jobs=n_jobs, backend='loky')(
+    delayed(fit_job)(path, fit, split,
+                     dict(params, n_jobs=trees_per_job) if fit is fit_rf else params)
+    for path, (fit, split, params) in specs.items()
+)
+
+# ------------------------------------------------------------
+# Step 4 — Report and save models
+# ------------------------------------------------------------
+for path, model, accuracy in results:
+    print(f"✅ {path}: accuracy {accuracy*100:.2f}%")
+    save_model(model, path)
+    print(f"💾 Saved model: {path}")
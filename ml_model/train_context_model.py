@@ -1,57 +1,37 @@
 # Purpose: Train context-aware color comfort model (semantic + visual features)
 # Language: Python 3 (scikit-learn)
 
-import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier
-import joblib
-import random
+
+from _common import (CONTEXT_FEATURES, CONTEXT_MODEL_PARAMS, load_pairs, split_dataset,
+                     add_context_features, feature_matrix, labels, fit_rf, save_model)
+
+# Seeded PCG64 generator so the simulated context is reproducible
+rng = np.random.default_rng(42)
 
 # ------------------------------------------------------------
 # Step 1 — Load Base Dataset
 # ------------------------------------------------------------
-base_path = 'data/color_pairs.csv'
-df = pd.read_csv(base_path)
+df = load_pairs()
 print(f"✅ Loaded base dataset: {len(df)} samples")
 
 # ------------------------------------------------------------
 # Step 2 — Add Contextual Features (simulated for now)
 # ------------------------------------------------------------
-element_types = ['button', 'a', 'footer', 'header', 'h1', 'p', 'span', 'div']
-element_map = {t: i+1 for i, t in enumerate(element_types)}
-
-def random_element():
-    t = random.choice(element_types)
-    return t, element_map[t]
-
-contexts = [random_element() for _ in range(len(df))]
-df['element_type'] = [c[0] for c in contexts]
-df['element_type_id'] = [c[1] for c in contexts]
-df['font_size'] = np.random.randint(10, 24, len(df))
-df['font_weight'] = np.random.choice([300, 400, 500, 600, 700], len(df))
+df = add_context_features(df, rng)
 
 # ------------------------------------------------------------
 # Step 3 — Select Features and Labels
 # ------------------------------------------------------------
-features = ['fg_r','fg_g','fg_b','bg_r','bg_g','bg_b','contrast_ratio',
-            'element_type_id','font_size','font_weight']
-X = df[features]
-y = df['label']
+X = feature_matrix(df, CONTEXT_FEATURES)
+y = labels(df)
 
 # ------------------------------------------------------------
 # Step 4 — Train Model
 # ------------------------------------------------------------
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-
-model = RandomForestClassifier(
-    n_estimators=200,
-    class_weight='balanced',
-    random_state=42,
-    max_depth=12
-)
+X_train, X_test, y_train, y_test = split_dataset(X, y)
 
-model.fit(X_train, y_train)
+model = fit_rf(X_train, y_train, **CONTEXT_MODEL_PARAMS)
 
 accuracy = model.score(X_test, y_test)
 print(f"✅ Context-Aware Model Accuracy: {accuracy*100:.2f}%")
@@ -60,5 +40,5 @@ print(f"✅ Context-Aware Model Accuracy: {accuracy*100:.2f}%")
 # Step 5 — Save Model
 # ------------------------------------------------------------
 out_path = 'ml_model/color_comfort_context.pkl'
-joblib.dump(model, out_path)
+save_model(model, out_path)
 print(f"💾 Saved context-aware model: {out_path}")
@@ -4,39 +4,38 @@
 # -------------------------------------------------
 # Step 1 — Import required libraries
 # -------------------------------------------------
-import pandas as pd
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier
+import argparse
 from sklearn.metrics import accuracy_score, classification_report
-import joblib
+
+from _common import (COLOR_FEATURES, BASE_MODEL_PARAMS, load_pairs, split_dataset,
+                     feature_matrix, labels, fit_hgb, save_model)
+
+parser = argparse.ArgumentParser(description="Train the color comfort model")
+parser.add_argument('--verbose', action='store_true', help="print the full classification report")
+args = parser.parse_args()
 
 # -------------------------------------------------
 # Step 2 — Load dataset
 # -------------------------------------------------
 # Load the CSV you generated in Phase 1
-data = pd.read_csv('data/color_pairs.csv')
+data = load_pairs()
 print(f"✅ Dataset loaded: {data.shape[0]} samples")
 
 # Define feature columns (inputs for the model)
-X = data[['fg_r', 'fg_g', 'fg_b', 'bg_r', 'bg_g', 'bg_b', 'contrast_ratio']]
+X = feature_matrix(data, COLOR_FEATURES)
 # Define the label (target)
-y = data['label']
+y = labels(data)
 
 # -------------------------------------------------
 # Step 3 — Split data into training and testing sets
 # -------------------------------------------------
 # We’ll use 80% of the data to train and 20% to test accuracy
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+X_train, X_test, y_train, y_test = split_dataset(X, y)
 
 # -------------------------------------------------
 # Step 4 — Create and train the model
 # -------------------------------------------------
-model = RandomForestClassifier(
-    n_estimators=200,   # number of decision trees
-    max_depth=8,        # depth of each tree
-    random_state=42
-)
-model.fit(X_train, y_train)
+model = fit_hgb(X_train, y_train, **BASE_MODEL_PARAMS)
 
 # -------------------------------------------------
 # Step 5 — Evaluate model performance
@@ -45,11 +44,12 @@ y_pred = model.predict(X_test)
 accuracy = accuracy_score(y_test, y_pred)
 
 print(f"✅ Model accuracy: {accuracy * 100:.2f}%")
-print("\nClassification Report:")
-print(classification_report(y_test, y_pred))
+if args.verbose:
+    print("\nClassification Report:")
+    print(classification_report(y_test, y_pred))
 
 # -------------------------------------------------
 # Step 6 — Save the trained model
 # -------------------------------------------------
-joblib.dump(model, 'ml_model/color_comfort_model.pkl')
+save_model(model, 'ml_model/color_comfort_model.pkl')
 print("💾 Model saved as: ml_model/color_comfort_model.pkl")